@@ -67,8 +67,9 @@ class SchemaEditorTests(TestCase):
 
     @property
     def trigger_editor(self):
-        with DatabaseSchemaEditor(connection) as schema_editor:
-            return DatabaseTriggerEditor(schema_editor)
+        # SQL-string generation never touches the connection, so don't
+        # enter the editor context (transaction, deferred sql flush) here
+        return DatabaseTriggerEditor(DatabaseSchemaEditor(connection))
 
     def test_sql_setweight(self):
 
@@ -101,8 +102,8 @@ class SchemaEditorTests(TestCase):
 
         check_sql(
             WithLanguageTwoColumn, [
-                """ setweight(to_tsvector('ukrainian', COALESCE(NEW."title", '')), 'A') ||""",
-                """ setweight(to_tsvector('ukrainian', COALESCE(NEW."body", '')), 'D');"""
+                """ setweight(to_tsvector('ukrainian', COALESCE(NEW."title", '')), 'A') ||\n"""
+                """   setweight(to_tsvector('ukrainian', COALESCE(NEW."body", '')), 'D');"""
             ]
         )
 
@@ -147,28 +148,78 @@ class SchemaEditorTests(TestCase):
 
         check_sql(
             OneColumn, [
-                "IF (TG_OP = 'INSERT') THEN do_update = true;",
+                "IF (TG_OP = 'INSERT' OR NEW.\"search\" IS NULL) THEN do_update = true;",
                 "ELSIF (TG_OP = 'UPDATE') THEN",
-                ' IF (NEW."search" IS NULL) THEN do_update = true;',
-                ' ELSIF (NEW."name" IS DISTINCT FROM OLD."name") THEN do_update = true;',
-                ' END IF;',
+                ' do_update = ROW(NEW."name") IS DISTINCT FROM ROW(OLD."name");',
                 'END IF;',
             ]
         )
 
         check_sql(
             ThreeColumns, [
-                "IF (TG_OP = 'INSERT') THEN do_update = true;",
+                "IF (TG_OP = 'INSERT' OR NEW.\"search\" IS NULL) THEN do_update = true;",
                 "ELSIF (TG_OP = 'UPDATE') THEN",
-                ' IF (NEW."search" IS NULL) THEN do_update = true;',
-                ' ELSIF (NEW."name" IS DISTINCT FROM OLD."name") THEN do_update = true;',
-                ' ELSIF (NEW."title" IS DISTINCT FROM OLD."title") THEN do_update = true;',
-                ' ELSIF (NEW."body" IS DISTINCT FROM OLD."body") THEN do_update = true;',
-                ' END IF;',
+                ' do_update = ROW(NEW."name", NEW."title", NEW."body")'
+                ' IS DISTINCT FROM ROW(OLD."name", OLD."title", OLD."body");',
                 'END IF;',
             ]
         )
 
+    def test_sql_trigger_update_of(self):
+
+        def check_sql(model, sql):
+            field = model._meta.get_field('search')
+            self.assertEqual(
+                sql, self.trigger_editor._trigger_update_of(field)
+            )
+
+        class TwoColumns(models.Model):
+            search = SearchVectorField([
+                WeightedColumn('title', 'A'),
+                WeightedColumn('body', 'D'),
+            ], 'english')
+
+        class WithLanguageColumn(models.Model):
+            search = SearchVectorField([
+                WeightedColumn('body', 'D'),
+            ], language_column='lang')
+
+        class ForceUpdate(models.Model):
+            search = SearchVectorField([
+                WeightedColumn('body', 'D'),
+            ], 'english', force_update=True)
+
+        check_sql(TwoColumns, ' OF "search", "title", "body"')
+        check_sql(WithLanguageColumn, ' OF "search", "lang", "body"')
+        check_sql(ForceUpdate, '')
+
+    def test_sql_trigger_update_when(self):
+
+        def check_sql(model, sql):
+            field = model._meta.get_field('search')
+            self.assertEqual(
+                sql, self.trigger_editor._trigger_update_when(field)
+            )
+
+        class TwoColumns(models.Model):
+            search = SearchVectorField([
+                WeightedColumn('title', 'A'),
+                WeightedColumn('body', 'D'),
+            ], 'english')
+
+        class ForceUpdate(models.Model):
+            search = SearchVectorField([
+                WeightedColumn('body', 'D'),
+            ], 'english', force_update=True)
+
+        check_sql(
+            TwoColumns,
+            ' WHEN (NEW."search" IS NULL'
+            ' OR ROW(NEW."title", NEW."body")'
+            ' IS DISTINCT FROM ROW(OLD."title", OLD."body"))'
+        )
+        check_sql(ForceUpdate, '')
+
     def test_sql_update_function(self):
 
         def check_sql(model, sql):
@@ -190,12 +241,10 @@ class SchemaEditorTests(TestCase):
             "DECLARE\n"
             " do_update bool default false;\n"
             "BEGIN\n"
-            " IF (TG_OP = 'INSERT') THEN do_update = true;\n"
+            " IF (TG_OP = 'INSERT' OR NEW.\"search\" IS NULL) THEN do_update = true;\n"
             " ELSIF (TG_OP = 'UPDATE') THEN\n"
-            '  IF (NEW."search" IS NULL) THEN do_update = true;\n'
-            '  ELSIF (NEW."title" IS DISTINCT FROM OLD."title") THEN do_update = true;\n'
-            '  ELSIF (NEW."body" IS DISTINCT FROM OLD."body") THEN do_update = true;\n'
-            "  END IF;\n"
+            '  do_update = ROW(NEW."title", NEW."body")'
+            ' IS DISTINCT FROM ROW(OLD."title", OLD."body");\n'
             " END IF;\n"
             " IF do_update THEN\n"
             '  NEW."search" :=\n'
@@ -249,11 +298,15 @@ class SchemaEditorTests(TestCase):
 
         with DatabaseSchemaEditor(connection) as schema_editor:
             schema_editor.create_model(TextDocument)
-            self.assertEqual(len(schema_editor.deferred_sql), 3)
+            self.assertEqual(len(schema_editor.deferred_sql), 4)
             self.assertIn('CREATE INDEX', schema_editor.deferred_sql[0])
             self.assertIn('GIN', schema_editor.deferred_sql[0])
             self.assertIn('CREATE FUNCTION', schema_editor.deferred_sql[1])
             self.assertIn('CREATE TRIGGER', schema_editor.deferred_sql[2])
+            self.assertIn('BEFORE INSERT', schema_editor.deferred_sql[2])
+            self.assertIn('CREATE TRIGGER', schema_editor.deferred_sql[3])
+            self.assertIn('UPDATE OF "search", "title"', schema_editor.deferred_sql[3])
+            self.assertIn('WHEN (NEW."search" IS NULL', schema_editor.deferred_sql[3])
 
 
 class MigrationTestCase(TestCase):
@@ -1,4 +1,6 @@
-from datetime import datetime
+from itertools import cycle
+from statistics import median
+from time import perf_counter_ns
 
 from django.contrib.postgres.search import SearchQuery, SearchRank
 from django.db import connection, models
@@ -99,20 +101,36 @@ class TriggerTests(TestCase):
         doc.refresh_from_db()
         self.assertEqual(doc.search, '')
 
+    @staticmethod
+    def timed(func, samples=5):
+        elapsed = []
+        for _ in range(samples):
+            start = perf_counter_ns()
+            func()
+            elapsed.append(perf_counter_ns() - start)
+        return median(elapsed)
+
     def test_performance_improvement_for_guarded_update(self):
 
-        text = HOLY_GRAIL
-        text2 = text.replace('king', 'ruler')
+        text, text2 = HOLY_GRAIL, HOLY_GRAIL_RULER
+
+        # warm up the statement and catalog caches so the first measured
+        # insert is not penalized relative to the updates
+        self.create(body=text).delete()
 
-        start = datetime.now()
-        doc = self.create(body=text)
-        create_elapsed = (datetime.now() - start).microseconds
+        docs = []
+        create_elapsed = self.timed(lambda: docs.append(self.create(body=text)))
+        doc = docs[-1]
         doc.refresh_from_db()
 
-        doc.body = text2
-        start = datetime.now()
-        doc.save(update_fields=['body'])
-        update_elapsed = (datetime.now() - start).microseconds
+        # alternate the body so every sample actually recomputes the vector
+        texts = cycle([text2, text])
+
+        def update_body():
+            doc.body = next(texts)
+            doc.save(update_fields=['body'])
+
+        update_elapsed = self.timed(update_body)
         doc.refresh_from_db()
 
         longest = max(create_elapsed, update_elapsed)
@@ -123,18 +141,20 @@ class TriggerTests(TestCase):
 
         # update not indexed column
         doc.other = text2
-        start = datetime.now()
-        doc.save(update_fields=['other'])
-        noindex_elapsed = (datetime.now() - start).microseconds
+
+        def update_other():
+            doc.save(update_fields=['other'])
+
+        noindex_elapsed = self.timed(update_other)
 
         # skipping unnecessary to_tsvector() call is faster
         self.assertGreater(longest, noindex_elapsed)
 
         # update indexed column with the same value
-        doc.body = text2
-        start = datetime.now()
-        doc.save(update_fields=['body'])
-        noindex_elapsed = (datetime.now() - start).microseconds
+        def update_body_unchanged():
+            doc.save(update_fields=['body'])
+
+        noindex_elapsed = self.timed(update_body_unchanged)
 
         # skipping unnecessary to_tsvector() call is faster
         self.assertGreater(longest, noindex_elapsed)
@@ -157,7 +177,10 @@ class TriggerTests(TestCase):
 
 
 @isolate_apps('tsvector_test_app')
-class QueryTests(TestCase):
+class TextDocumentTestCase(TestCase):
+    # The model is redefined per test on purpose: hoisting it to class or
+    # module scope would register it in the shared app registry outside of
+    # isolate_apps() and leak it into every other test.
 
     def setUp(self):
 
@@ -172,16 +195,21 @@ class QueryTests(TestCase):
         with DatabaseSchemaEditor(connection) as schema_editor:
             schema_editor.create_model(TextDocument)
 
-        TextDocument.objects.create(
-            title="My hovercraft is full of eels.",
-            body="Spam! Spam! Spam! Spam! Spam! Spam!",
-        )
-        TextDocument.objects.create(
-            title="Spam! Spam! Spam! Spam! Spam! Spam!",
-            body="My hovercraft is full of eels."
-        )
+        TextDocument.objects.bulk_create([
+            TextDocument(
+                title="My hovercraft is full of eels.",
+                body="Spam! Spam! Spam! Spam! Spam! Spam!",
+            ),
+            TextDocument(
+                title="Spam! Spam! Spam! Spam! Spam! Spam!",
+                body="My hovercraft is full of eels."
+            ),
+        ])
         self.objects = TextDocument.objects
 
+
+class QueryTests(TextDocumentTestCase):
+
     def search(self, terms):
         return list(self.objects.filter(search=terms).values_list('id', flat=True))
 
@@ -189,6 +217,14 @@ class QueryTests(TestCase):
         self.assertEqual(self.search('hovercraft'), [1, 2])
         self.assertEqual(self.search('spam'), [1, 2])
 
+    def test_search_uses_stored_vector(self):
+        # filtering on the field compares against the stored column, which
+        # postgres can satisfy from the GIN index; an inline to_tsvector()
+        # expression would force a sequential scan
+        sql = str(self.objects.filter(search='hovercraft').query)
+        self.assertIn('"search" @@', sql)
+        self.assertNotIn('to_tsvector', sql)
+
     def ranked_search(self, terms):
         return list(self.objects
                     .annotate(rank=SearchRank(F('search'), SearchQuery(terms, config='english')))
@@ -200,31 +236,7 @@ class QueryTests(TestCase):
         self.assertEqual(self.ranked_search('spam'), [2, 1])
 
 
-@isolate_apps('tsvector_test_app')
-class HeadlineTests(TestCase):
-
-    def setUp(self):
-
-        class TextDocument(models.Model):
-            title = models.CharField(max_length=128)
-            body = models.TextField()
-            search = SearchVectorField([
-                WeightedColumn('title', 'A'),
-                WeightedColumn('body', 'D'),
-            ], 'english')
-
-        with DatabaseSchemaEditor(connection) as schema_editor:
-            schema_editor.create_model(TextDocument)
-
-        TextDocument.objects.create(
-            title="My hovercraft is full of eels.",
-            body="Spam! Spam! Spam! Spam! Spam! Spam!",
-        )
-        TextDocument.objects.create(
-            title="Spam! Spam! Spam! Spam! Spam! Spam!",
-            body="My hovercraft is full of eels."
-        )
-        self.objects = TextDocument.objects
+class HeadlineTests(TextDocumentTestCase):
 
     def test_headline(self):
         query = SearchQuery('hovercraft')
@@ -286,3 +298,5 @@ Dennis: Oh! Come and see the violence inherent in the system! Help, help, I'm be
 Arthur: Bloody Peasant!
 Dennis: Ooh, what a giveaway! Did you hear that? Did you hear that, eh? That's what I'm on about! Did you see him repressing me? You saw him, didn't you?
 """
+
+HOLY_GRAIL_RULER = HOLY_GRAIL.replace('king', 'ruler')
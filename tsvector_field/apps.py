@@ -19,12 +19,11 @@ class TextSearchVectorConfig(AppConfig):
            ./manage.py migrate --run-syncdb. So if you are building apps without migrations
            you will have to use the more reliable approach in option #1.
 
+        The receiver checks at migrate time whether the database being migrated
+        is already configured with our DatabaseSchemaEditor (option #1) and
+        backs off, so no schema editor needs to be built here at startup.
+
         """
-        from django.db import connection
-        from . import DatabaseSchemaEditor
-        if not isinstance(connection.schema_editor(), DatabaseSchemaEditor):
-            # only register for pre_migrate if we're not already configured
-            # with the DatabaseSchemaEditor, see option #1 in doc above
-            from django.db.models.signals import pre_migrate
-            from .receivers import inject_trigger_operations
-            pre_migrate.connect(inject_trigger_operations)
+        from django.db.models.signals import pre_migrate
+        from .receivers import inject_trigger_operations
+        pre_migrate.connect(inject_trigger_operations)
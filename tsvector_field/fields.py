@@ -51,6 +51,11 @@ class SearchVectorField(OriginalSearchVectorField):
         self.force_update = kwargs.pop('force_update', False)
         kwargs['db_index'] = False  # we create GIN index ourselves
         kwargs['null'] = True
+        # columns, language and language_column are fixed once the class is
+        # defined, so the schema editor caches the assembled SQL here
+        self._tsvector_weights = None
+        self._tsvector_preconditions = None
+        self._textual_columns = None
         super().__init__(*args, **kwargs)
 
     def deconstruct(self):
@@ -75,14 +80,18 @@ class SearchVectorField(OriginalSearchVectorField):
         return errors
 
     def _find_textual_columns(self):
-        columns = []
-        # PostgreSQL trigger only has access to fields in the table, so we
-        # need to make sure to exclude any fields from multi-table inheritance
-        for field in self.model._meta.get_fields(include_parents=False):
-            # too restrictive?
-            if isinstance(field, (CharField, TextField)):
-                columns.append(field.column)
-        return columns
+        # the model's fields don't change once the class is defined, so the
+        # scan only needs to happen on the first check() call
+        if self._textual_columns is None:
+            columns = []
+            # PostgreSQL trigger only has access to fields in the table, so we
+            # need to make sure to exclude any fields from multi-table inheritance
+            for field in self.model._meta.get_fields(include_parents=False):
+                # too restrictive?
+                if isinstance(field, (CharField, TextField)):
+                    columns.append(field.column)
+            self._textual_columns = columns
+        return self._textual_columns
 
     def _check_columns_attribute(self, textual_columns):
         if not self.columns:
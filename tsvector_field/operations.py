@@ -1,5 +1,6 @@
 from django.db.migrations.operations.fields import FieldOperation
 from .fields import SearchVectorField
+from .schema import DatabaseTriggerEditor
 
 
 class IndexSearchVector(FieldOperation):
@@ -12,10 +13,19 @@ class IndexSearchVector(FieldOperation):
         if self.allow_migrate_model(schema_editor.connection.alias, to_model):
             to_field = to_model._meta.get_field(self.name)
             assert isinstance(to_field, SearchVectorField)
+            expression = 'NULL'
+            if to_field.columns:
+                # write the vector directly: one pass over the table instead
+                # of a NULL reset plus the trigger rewriting every row again
+                expression = ' || '.join(
+                    DatabaseTriggerEditor(schema_editor)
+                    ._tsvector_setweight_parts(to_field, record='')
+                )
             schema_editor.deferred_sql.append(
-                'UPDATE {table} SET {column} = NULL'.format(
+                'UPDATE {table} SET {column} = {expression}'.format(
                     column=to_field.column,
-                    table=to_model._meta.db_table
+                    table=to_model._meta.db_table,
+                    expression=expression
                 )
             )
 
@@ -5,11 +5,15 @@ from django.contrib.postgres.search import Value, Func
 class Headline(Func):
     function = 'ts_headline'
 
+    # fields are stateless once constructed, so share one default instead
+    # of allocating a TextField per annotation
+    _default_output_field = models.TextField()
+
     def __init__(self, field, query, config=None, options=None, **extra):
         expressions = [field, query]
         if config:
             expressions.insert(0, Value(config))
         if options:
             expressions.append(Value(options))
-        extra.setdefault('output_field', models.TextField())
+        extra.setdefault('output_field', self._default_output_field)
         super().__init__(*expressions, **extra)
@@ -1,7 +1,5 @@
 from django.db.migrations.operations.base import Operation
 
-from .schema import DatabaseTriggerEditor
-
 
 class _TriggerEditorOperation(Operation):
 
@@ -9,24 +7,51 @@ class _TriggerEditorOperation(Operation):
         pass
 
     def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        from .schema import DatabaseTriggerEditor
         super().database_forwards(app_label, DatabaseTriggerEditor(schema_editor), from_state, to_state)
 
     def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        from .schema import DatabaseTriggerEditor
         super().database_backwards(app_label, DatabaseTriggerEditor(schema_editor), from_state, to_state)
 
 
-def inject_trigger_operations(plan=None, **kwargs):
+# one synthesized class per wrapped operation class, instead of a fresh
+# class object for every operation in every planned migration
+_trigger_operation_types = {}
+
+
+def _trigger_operation_type(operation_class):
+    try:
+        return _trigger_operation_types[operation_class]
+    except KeyError:
+        return _trigger_operation_types.setdefault(operation_class, type(
+            'TriggerEditorOperation', (_TriggerEditorOperation, operation_class), {}
+        ))
+
+
+def inject_trigger_operations(plan=None, using=None, **kwargs):
 
     if plan is None:
         return
 
+    if using is not None:
+        # schema.py (and the backend schema machinery it pulls in) is only
+        # imported here, once a migration is actually about to run
+        from django.db import connections
+        from .schema import DatabaseSchemaEditor
+        editor_class = connections[using].SchemaEditorClass
+        if editor_class and issubclass(editor_class, DatabaseSchemaEditor):
+            # already configured with the DatabaseSchemaEditor which
+            # manages the triggers itself, see option #1 in apps.py
+            return
+
     for migration, backward in plan:
 
         inserts = []
         for index, operation in enumerate(migration.operations):
             clsname, args, kwargs = operation.deconstruct()
             if clsname in ('CreateModel', 'DeleteModel', 'AddField', 'RemoveField', 'AlterField'):
-                newop = type('TriggerEditorOperation', (_TriggerEditorOperation, operation.__class__), {})
+                newop = _trigger_operation_type(operation.__class__)
                 if clsname in ('DeleteModel', 'RemoveField'):
                     # inject operation ahead of the original as we
                     # need to introspect the not-yet-deleted field
@@ -21,6 +21,18 @@ class DatabaseSchemaEditor(PostgreSQLSchemaEditor):
 
     """
 
+    # Deferred statements (indexes, functions, triggers) are sent to the
+    # server in a single execute() instead of one round-trip each; set to
+    # False to get per-statement execution and logging back for debugging.
+    batch_deferred_sql = True
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.batch_deferred_sql and exc_type is None and \
+                not self.collect_sql and len(self.deferred_sql) > 1:
+            self.execute(';\n'.join(str(sql) for sql in self.deferred_sql))
+            self.deferred_sql = []
+        super().__exit__(exc_type, exc_value, traceback)
+
     def create_model(self, model):
         super().create_model(model)
         DatabaseTriggerEditor(self).create_model(model)
@@ -46,12 +58,17 @@ class DatabaseTriggerEditor:
 
     def __init__(self, schema_editor):
         self.schema_editor = schema_editor
-        self.deferred_sql = schema_editor.deferred_sql
 
     # Instead of directly inheriting from the DatabaseSchemaEditor
     # we piecemeal expose the necessary functionality in case something
     # changes in the base class that has unintended consequences.
 
+    @property
+    def deferred_sql(self):
+        # resolved lazily: the schema editor only creates deferred_sql on
+        # __enter__, and the SQL-generation paths never need it
+        return self.schema_editor.deferred_sql
+
     def quote_name(self, name):
         return self.schema_editor.quote_name(name)
 
@@ -94,59 +111,79 @@ class DatabaseTriggerEditor:
         return (
             self._create_index_name(model, [field.column], '_tsvector'),
             self._create_index_name(model, [field.column], '_function')+'()',
-            self._create_index_name(model, [field.column], '_trigger')
+            self._create_index_name(model, [field.column], '_trigger'),
+            self._create_index_name(model, [field.column], '_trigger_update')
         )
 
     def _to_tsvector_weights(self, field):
+        if field._tsvector_weights is None:
+            field._tsvector_weights = self._build_tsvector_weights(field)
+        return field._tsvector_weights
+
+    sql_setweight = (
+        "setweight(to_tsvector({language}, COALESCE({record}{column}, '')), {weight})"
+    )
+
+    def _tsvector_language(self, field, record):
 
         if field.language_column and field.language:
-            language = 'COALESCE(NEW.{}::regconfig, {})'.format(
-                self.quote_name(field.language_column),
-                self.quote_value(field.language)
+            return 'COALESCE({record}{column}::regconfig, {language})'.format(
+                record=record,
+                column=self.quote_name(field.language_column),
+                language=self.quote_value(field.language)
             )
 
         elif field.language_column:
-            language = 'NEW.{}::regconfig'.format(
-                self.quote_name(field.language_column)
+            return '{record}{column}::regconfig'.format(
+                record=record,
+                column=self.quote_name(field.language_column)
             )
 
         else:
-            language = self.quote_value(field.language or 'english')
-
-        sql_setweight = (
-            " setweight(to_tsvector({language}, COALESCE(NEW.{column}, '')), {weight}) ||"
-        )
+            return self.quote_value(field.language or 'english')
 
-        weights = []
-        for column in field.columns:
-            weights.append(sql_setweight.format(
-                language=language,
-                column=self.quote_name(column.name),
-                weight=self.quote_value(column.weight)
-            ))
-        weights[-1] = weights[-1][:-3] + ';'
+    def _tsvector_setweight_parts(self, field, record='NEW.'):
+        language = self._tsvector_language(field, record)
+        return [self.sql_setweight.format(
+            language=language,
+            record=record,
+            column=self.quote_name(column.name),
+            weight=self.quote_value(column.weight)
+        ) for column in field.columns]
 
-        return weights
+    def _build_tsvector_weights(self, field):
+        return [' ' + ' ||\n   '.join(self._tsvector_setweight_parts(field)) + ';']
 
     def _to_tsvector(self, field):
         yield "NEW.{} :=".format(self.quote_name(field.column))
         yield from self._to_tsvector_weights(field)
 
     def _to_tsvector_preconditions(self, field):
-        yield "IF (TG_OP = 'INSERT') THEN do_update = true;"
-        yield "ELSIF (TG_OP = 'UPDATE') THEN"
-        yield " IF (NEW.{column} IS NULL) THEN do_update = true;".format(
+        # cached on the field for the same reason as the weights above:
+        # this package only targets the PostgreSQL backend, so the quoting
+        # (and therefore the SQL) never varies between connections
+        if field._tsvector_preconditions is None:
+            field._tsvector_preconditions = list(self._build_tsvector_preconditions(field))
+        return field._tsvector_preconditions
+
+    def _build_tsvector_preconditions(self, field):
+        # a single composite-row comparison is one expression evaluation,
+        # short-circuiting in C on the first differing column, instead of
+        # an interpreted IF/ELSIF ladder or per-column operator dispatch
+        yield "IF (TG_OP = 'INSERT' OR NEW.{column} IS NULL) THEN do_update = true;".format(
             column=self.quote_name(field.column)
         )
-
-        for column in field.columns:
-            yield " ELSIF (NEW.{column} IS DISTINCT FROM OLD.{column}) THEN do_update = true;".format(
-                column=self.quote_name(column.name)
-            )
-
-        yield " END IF;"
+        yield "ELSIF (TG_OP = 'UPDATE') THEN"
+        yield " do_update = {};".format(self._row_is_distinct(field))
         yield "END IF;"
 
+    def _row_is_distinct(self, field):
+        columns = [self.quote_name(column.name) for column in field.columns]
+        return 'ROW({new}) IS DISTINCT FROM ROW({old})'.format(
+            new=', '.join('NEW.' + column for column in columns),
+            old=', '.join('OLD.' + column for column in columns)
+        )
+
     sql_create_function = (
         "CREATE FUNCTION {function} RETURNS trigger AS $$\n"
         "DECLARE\n"
@@ -175,14 +212,53 @@ class DatabaseTriggerEditor:
         "CREATE INDEX {index} ON {table} USING {index_type} ({column})"
     )
 
-    sql_create_trigger = (
-        "CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE"
+    # We generate our own trigger function instead of composing the built-in
+    # tsvector_update_trigger()/tsvector_update_trigger_column() with
+    # suppress_redundant_updates_trigger(): the built-ins cannot produce
+    # setweight()ed vectors, the _column variant requires a NOT NULL
+    # regconfig column (no fallback language), and the suppression trigger
+    # makes no-op saves report zero affected rows which Django's
+    # save(update_fields=...) raises as a DatabaseError.
+    #
+    # INSERT and UPDATE get separate triggers because a WHEN clause may
+    # not reference OLD on a trigger that also fires for INSERT.
+    sql_create_insert_trigger = (
+        "CREATE TRIGGER {trigger} BEFORE INSERT"
         " ON {table} FOR EACH ROW EXECUTE PROCEDURE {function}"
     )
 
+    sql_create_update_trigger = (
+        "CREATE TRIGGER {trigger} BEFORE UPDATE{update_of}"
+        " ON {table} FOR EACH ROW{when} EXECUTE PROCEDURE {function}"
+    )
+
+    def _trigger_update_when(self, field):
+        # mirrors the function's guard so updates that can't change the
+        # vector are rejected before PL/pgSQL is even entered
+        if field.force_update:
+            return ''
+        return ' WHEN (NEW.{column} IS NULL OR {row_check})'.format(
+            column=self.quote_name(field.column),
+            row_check=self._row_is_distinct(field)
+        )
+
+    def _trigger_update_of(self, field):
+        # Scope the trigger to the columns that can affect the vector so
+        # it never fires for unrelated updates. The vector column itself
+        # is included so resetting it to NULL (see IndexSearchVector)
+        # still triggers a rebuild. force_update fields keep firing on
+        # every update since their contract is to always recompute.
+        if field.force_update:
+            return ''
+        columns = [field.column]
+        if field.language_column:
+            columns.append(field.language_column)
+        columns.extend(column.name for column in field.columns)
+        return ' OF {}'.format(', '.join(self.quote_name(c) for c in columns))
+
     def _create_tsvector(self, model, field):
 
-        index, function, trigger = self.get_names(model, field)
+        index, function, trigger, update_trigger = self.get_names(model, field)
         table = self.quote_name(model._meta.db_table)
 
         yield self.sql_create_index.format(
@@ -197,21 +273,33 @@ class DatabaseTriggerEditor:
 
         yield self._create_function(function, field)
 
-        yield self.sql_create_trigger.format(
+        yield self.sql_create_insert_trigger.format(
             trigger=self.quote_name(trigger),
             table=table,
             function=function,
         )
 
+        yield self.sql_create_update_trigger.format(
+            trigger=self.quote_name(update_trigger),
+            update_of=self._trigger_update_of(field),
+            when=self._trigger_update_when(field),
+            table=table,
+            function=function,
+        )
+
     def _drop_tsvector(self, model, field):
 
-        index, function, trigger = self.get_names(model, field)
+        index, function, trigger, update_trigger = self.get_names(model, field)
         table = self.quote_name(model._meta.db_table)
 
         yield "DROP TRIGGER IF EXISTS {trigger} ON {table}".format(
             trigger=trigger, table=table,
         )
 
+        yield "DROP TRIGGER IF EXISTS {trigger} ON {table}".format(
+            trigger=update_trigger, table=table,
+        )
+
         yield "DROP FUNCTION IF EXISTS {function}".format(
             function=function,
         )